@@ -49,10 +49,9 @@ def process_schema(dataschema: DataSchema, strict_merge: bool = False) -> DataTr
             step.tag = f"{si}"
 
         todofiles = step.input.paths()
-        vals = None
+        trees = []
         if len(todofiles) == 0:
             logger.warning(f"No files processed by step '{step.tag}'.")
-            vals = {}
         for tf in todofiles:
             logger.info(f"Processing file '{tf}'.")
             tasks = extract_from_path(
@@ -74,9 +73,10 @@ def process_schema(dataschema: DataSchema, strict_merge: bool = False) -> DataTr
                     if k in fvals[name].attrs:
                         del fvals[name].attrs[k]
 
-            vals = dgutils.merge_dicttrees(vals, fvals, concatmode)
+            trees.append(fvals)
 
-        stepdt = DataTree.from_dict({} if vals is None else vals)
+        vals = dgutils.merge_dicttrees(trees, concatmode)
+        stepdt = DataTree.from_dict(vals)
         stepdt.name = step.tag
         root[step.tag] = stepdt
     return root
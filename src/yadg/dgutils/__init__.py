@@ -10,7 +10,13 @@ from .dateutils import (
 from .schemautils import update_schema, schema_from_preset
 from .btools import read_value
 from .pintutils import sanitize_units, ureg
-from .dsutils import dicts_to_dataset, append_dicts, merge_dicttrees, merge_meta
+from .dsutils import (
+    dicts_to_dataset,
+    append_dicts,
+    merge_dicttrees,
+    merge_datatrees,
+    merge_meta,
+)
 
 __all__ = [
     "get_yadg_metadata",
@@ -28,5 +34,6 @@ __all__ = [
     "dicts_to_dataset",
     "append_dicts",
     "merge_dicttrees",
+    "merge_datatrees",
     "merge_meta",
 ]
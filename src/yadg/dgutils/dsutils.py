@@ -1,11 +1,14 @@
 import numpy as np
 import xarray as xr
-from xarray import Dataset
+from xarray import Dataset, DataTree
 from typing import Any
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Numpy dtype kinds for which std_err variables are generated.
+_numeric_kinds = frozenset("iufcmM")
+
 
 def append_dicts(
     vals: dict[str, Any],
@@ -26,9 +29,11 @@ def append_dicts(
             meta[k] = [np.nan] * li
         meta[k].append(v)
 
-    for k in set(data) - set(vals):
+    # Use dict-view arithmetic to find keys missing from this row, which avoids
+    # building two throwaway sets of all known keys on every call.
+    for k in data.keys() - vals.keys():
         data[k].append(np.nan)
-    for k in set(meta) - set(devs):
+    for k in meta.keys() - devs.keys():
         if k != "_fn":
             meta[k].append(np.nan)
 
@@ -52,12 +57,15 @@ def dicts_to_dataset(
             k = key.replace("/", "_")
         else:
             k = key
-        darrs[k] = xr.DataArray(data=val, dims=["uts"], attrs=attrs)
-        if key in meta and darrs[k].dtype.kind in {"i", "u", "f", "c", "m", "M"}:
+        # Coerce to ndarray once and build Variables directly, skipping the
+        # redundant index and coordinate inference of the DataArray constructor.
+        arr = np.asarray(val)
+        darrs[k] = xr.Variable(("uts",), arr, attrs)
+        if key in meta and arr.dtype.kind in _numeric_kinds:
             err = f"{k}_std_err"
             darrs[k].attrs["ancillary_variables"] = err
             attrs["standard_name"] = f"{k} standard_error"
-            darrs[err] = xr.DataArray(data=meta[key], dims=["uts"], attrs=attrs)
+            darrs[err] = xr.Variable(("uts",), np.asarray(meta[key]), attrs)
     if "uts" in data:
         coords = dict(uts=data.pop("uts"))
     else:
@@ -69,17 +77,34 @@ def dicts_to_dataset(
     return xr.Dataset(data_vars=darrs, coords=coords, attrs=attrs)
 
 
-def merge_dicttrees(vals: dict, fvals: dict, mode: str) -> dict:
+def merge_dicttrees(fvals: list[dict], mode: str) -> dict:
     """
-    A helper function that merges two ``DataTree.to_dict()`` objects by concatenating
-    the new values in ``fvals`` to the existing ones in ``vals``.
+    A helper function that merges a list of ``DataTree.to_dict()`` objects by
+    concatenating the values of each node along the ``uts`` dimension.
 
+    The concatenation is carried out in a single :func:`xarray.concat` call per node,
+    instead of folding the files in one-by-one.
     """
-    if vals is None:
-        return fvals
-    for k in fvals.keys():
+    if len(fvals) == 0:
+        return {}
+    if len(fvals) == 1:
+        return fvals[0]
+    nodes = {}
+    for fv in fvals:
+        for k, v in fv.items():
+            nodes.setdefault(k, []).append(v)
+    vals = {}
+    for k, v in nodes.items():
+        if len(v) != len(fvals):
+            raise RuntimeError(
+                "Merging data from multiple files has failed, as some of the "
+                "nodes are not present in all files. This might be caused by "
+                "trying to parse data obtained using different "
+                "techniques/protocols in a single step."
+                f"\n{k=}"
+            )
         try:
-            vals[k] = xr.concat([vals[k], fvals[k]], dim="uts", combine_attrs=mode)
+            vals[k] = xr.concat(v, dim="uts", combine_attrs=mode)
         except xr.MergeError:
             raise RuntimeError(
                 "Merging metadata from multiple files has failed, as some of the "
@@ -87,12 +112,44 @@ def merge_dicttrees(vals: dict, fvals: dict, mode: str) -> dict:
                 "parse data obtained using different techniques/protocols in a "
                 "single step. If you are certain this is what you want, try using "
                 "yadg with the '--ignore-merge-errors' option."
-                f"\n{vals[k].attrs=}"
-                f"\n{fvals[k].attrs=}"
+                f"\n{k=}"
+                f"\n{[ds.attrs for ds in v]=}"
             )
     return vals
 
 
+def merge_datatrees(dts: list[DataTree], mode: str) -> DataTree:
+    """
+    A helper function that merges a list of :class:`DataTree` objects by concatenating
+    the matching nodes along the ``uts`` dimension.
+
+    Works directly on the tree nodes, without round-tripping every file through
+    ``DataTree.to_dict()`` and back.
+    """
+    nodes = {}
+    for dt in dts:
+        for node in dt.subtree:
+            nodes.setdefault(node.path, []).append(node.to_dataset())
+    vals = {}
+    for k, v in nodes.items():
+        if len(v) == 1:
+            vals[k] = v[0]
+        else:
+            try:
+                vals[k] = xr.concat(v, dim="uts", combine_attrs=mode)
+            except xr.MergeError:
+                raise RuntimeError(
+                    "Merging metadata from multiple files has failed, as some of the "
+                    "values differ between files. This might be caused by trying to "
+                    "parse data obtained using different techniques/protocols in a "
+                    "single step. If you are certain this is what you want, try using "
+                    "yadg with the '--ignore-merge-errors' option."
+                    f"\n{k=}"
+                    f"\n{[ds.attrs for ds in v]=}"
+                )
+    return DataTree.from_dict(vals)
+
+
 def merge_meta(old: dict, new: dict):
     for k, v in new.items():
         if k not in old:
@@ -109,7 +109,26 @@ def extract_from_path(
 ) -> DataTree:
     with open(source, "rb") as inf:
         ch = inf.read()
+    return extract_raw_bytes(source=ch, timezone=timezone)
 
+
+@extract.register(bytes)
+def extract_from_bytes(
+    source: bytes,
+    *,
+    timezone: str,
+    **kwargs: dict,
+) -> DataTree:
+    return extract_raw_bytes(source=source, timezone=timezone)
+
+
+def extract_raw_bytes(
+    *,
+    source: bytes,
+    timezone: str,
+    **kwargs: dict,
+) -> DataTree:
+    ch = source
     magic = dgutils.read_value(ch, 0, "utf-8")
     pars = {}
     orig_meta = {}
@@ -41,9 +41,10 @@ The following metadata is extracted:
 
 """
 
-import zipfile
-import tempfile
 import os
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from xarray import DataTree
 from pathlib import Path
 from yadg.extractors import get_extract_dispatch
@@ -60,13 +61,16 @@ def extract_from_path(
     timezone: str,
     **kwargs: dict,
 ) -> DataTree:
-    zf = zipfile.ZipFile(source)
-    with tempfile.TemporaryDirectory() as tempdir:
-        zf.extractall(tempdir)
-        dt = None
-        filenames = [ffn for ffn in os.listdir(tempdir) if ffn.endswith("CH")]
-        for ffn in sorted(filenames):
-            path = Path(tempdir) / ffn
-            fdt = extract_ch(source=path, timezone=timezone, **kwargs)
-            dt = dgutils.merge_dicttrees(dt, fdt.to_dict(), "identical")
-    return DataTree.from_dict(dt)
+    # ZipFile reads are not thread-safe, so the members are read serially and
+    # only their parsing is dispatched onto the thread pool.
+    with zipfile.ZipFile(source) as zf:
+        members = [
+            zf.read(ffn) for ffn in sorted(n for n in zf.namelist() if n.endswith("CH"))
+        ]
+    func = partial(extract_ch, timezone=timezone, **kwargs)
+    if len(members) > 1:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+            fdts = list(ex.map(func, members))
+    else:
+        fdts = [func(m) for m in members]
+    return dgutils.merge_datatrees(fdts, "identical")
@@ -79,7 +79,9 @@ def process_row(
         headers.
 
     datefunc
-        A function that will generate ``uts`` given a list of values.
+        A function that will generate ``uts`` given a list of values. If it is
+        :obj:`None`, no ``uts`` entry is generated and the ``datecolumns`` are
+        simply skipped.
 
     datecolumns
         Column indices that need to be passed to ``datefunc`` to generate uts.
@@ -101,7 +103,8 @@ def process_row(
     columns = [column.strip() for column in items]
 
     # Process raw data, assign sigma and units
-    vals["uts"] = datefunc(*[columns[i] for i in datecolumns])
+    if datefunc is not None:
+        vals["uts"] = datefunc(*[columns[i] for i in datecolumns])
     for ci, header in enumerate(headers):
         if ci in datecolumns:
             continue
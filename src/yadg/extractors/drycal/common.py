@@ -8,10 +8,11 @@ and ensuring timestamps are increasing.
 
 """
 
-from pydantic import BaseModel
-from typing import Optional
+from pathlib import Path
 from xarray import Dataset
 import logging
+import numpy as np
+import pandas as pd
 import xarray as xr
 from striprtf.striprtf import rtf_to_text
 
@@ -21,13 +22,46 @@ from yadg.extractors.basic.csv import process_row
 logger = logging.getLogger(__name__)
 
 
-class TimeDate(BaseModel):
-    class TimestampSpec(BaseModel, extra="forbid"):
-        index: Optional[int] = None
-        format: Optional[str] = None
+def time_to_uts(col: list[str], fmt: str) -> list[float]:
+    """
+    Converts a column of time strings into seconds from midnight, using a single
+    vectorized :func:`pandas.to_datetime` call instead of a per-row
+    :func:`datetime.datetime.strptime`.
+    """
+    times = pd.to_datetime([i.strip() for i in col], format=fmt)
+    return (times - times.normalize()).total_seconds().tolist()
+
+
+def table_to_dicts(
+    headers: list,
+    data: list,
+    uts: list[float],
+) -> tuple[dict, dict]:
+    """
+    Transposes the processed table rows directly into columns.
 
-    date: Optional[TimestampSpec] = None
-    time: Optional[TimestampSpec] = None
+    The values and uncertainties are accumulated column-wise while the rows are
+    processed, so the output can be passed straight to
+    :func:`~yadg.dgutils.dsutils.dicts_to_dataset` without a list-of-dicts round trip.
+    """
+    colheaders = [h for hi, h in enumerate(headers[1:]) if hi != 4]
+    data_vals = {h: [] for h in colheaders}
+    meta_vals = {h: [] for h in colheaders}
+    for point in data:
+        vals, devs = process_row(headers[1:], point[1:], None, [4])
+        for h in colheaders:
+            data_vals[h].append(vals.get(h, np.nan))
+            meta_vals[h].append(devs.get(h, np.nan))
+    # Coerce each column to float64 in a single pass; columns with non-numeric
+    # entries are left as-is and will not carry uncertainties downstream.
+    for h in colheaders:
+        try:
+            data_vals[h] = np.asarray(data_vals[h], dtype=np.float64)
+        except ValueError:
+            continue
+        meta_vals[h] = np.asarray(meta_vals[h], dtype=np.float64)
+    data_vals["uts"] = np.asarray(uts, dtype=np.float64)
+    return data_vals, meta_vals
 
 
 def rtf(
@@ -38,10 +72,10 @@ def rtf(
     with open(fn, "r", encoding=encoding) as infile:
         rtf = infile.read()
     lines = rtf_to_text(rtf).split("\n")
-    for li in range(len(lines)):
-        if lines[li].startswith("Sample"):
+    for li, line in enumerate(lines):
+        if line.startswith("Sample"):
             si = li
-        elif lines[li].startswith("1|"):
+        elif line.startswith("1|"):
             di = li
             break
     # Metadata processing for rtf files is in columns, not rows.
@@ -52,7 +86,11 @@ def rtf(
             items = [i.strip() for i in line.split("|")]
             if len(items) > 1:
                 ml.append(items)
-    assert len(ml) == 2 and len(ml[0]) == len(ml[1])
+    if len(ml) != 2 or len(ml[0]) != len(ml[1]):
+        raise RuntimeError(
+            f"Could not process the metadata section of DryCal file '{fn}': "
+            "expected two metadata rows of equal length."
+        )
     for i in range(len(ml[0])):
         if ml[0][i] != "":
             metadata[ml[0][i]] = ml[1][i]
@@ -64,17 +102,10 @@ def rtf(
         if line.strip() != "":
             dl.append(line)
     headers, units, data = drycal_table(dl, sep="|")
-    datecolumns, datefunc, _ = dgutils.infer_timestamp_from(
-        spec=TimeDate(time={"index": 4, "format": "%I:%M:%S %p"}), timezone=timezone
-    )
+    uts = time_to_uts([point[5] for point in data], "%I:%M:%S %p")
 
     # Process rows
-    data_vals = {}
-    meta_vals = {"_fn": []}
-    for pi, point in enumerate(data):
-        vals, devs = process_row(headers[1:], point[1:], datefunc, datecolumns)
-        dgutils.append_dicts(vals, devs, data_vals, meta_vals, fn, pi)
-
+    data_vals, meta_vals = table_to_dicts(headers, data, uts)
     return dgutils.dicts_to_dataset(data_vals, meta_vals, units, False)
 
 
@@ -84,12 +115,11 @@ def sep(
     encoding: str,
     timezone: str,
 ) -> Dataset:
-    with open(fn, "r", encoding=encoding) as infile:
-        lines = infile.readlines()
-    for li in range(len(lines)):
-        if lines[li].startswith("Sample"):
+    lines = Path(fn).read_text(encoding=encoding).splitlines()
+    for li, line in enumerate(lines):
+        if line.startswith("Sample"):
             si = li
-        elif lines[li].startswith(f"1{sep}"):
+        elif line.startswith(f"1{sep}"):
             di = li
             break
     # Metadata processing for csv files is standard.
@@ -112,17 +142,10 @@ def sep(
         fmt = "%I:%M:%S %p"
     else:
         fmt = "%H:%M:%S"
-    datecolumns, datefunc, _ = dgutils.infer_timestamp_from(
-        spec=TimeDate(time={"index": 4, "format": fmt}), timezone=timezone
-    )
+    uts = time_to_uts([point[5] for point in data], fmt)
 
     # Process rows
-    data_vals = {}
-    meta_vals = {"_fn": []}
-    for pi, point in enumerate(data):
-        vals, devs = process_row(headers[1:], point[1:], datefunc, datecolumns)
-        dgutils.append_dicts(vals, devs, data_vals, meta_vals, fn, pi)
-
+    data_vals, meta_vals = table_to_dicts(headers, data, uts)
     return dgutils.dicts_to_dataset(data_vals, meta_vals, units, False)
 
 
@@ -138,7 +161,6 @@ def drycal_table(lines: list, sep: str = ",") -> tuple[list, dict, list]:
     items = [i.strip() for i in lines[0].split(sep)]
     headers = []
     units = {}
-    data = []
     trim = False
     for item in items:
         for rs in [". ", " "]:
@@ -153,13 +175,15 @@ def drycal_table(lines: list, sep: str = ",") -> tuple[list, dict, list]:
     if items[-1] == "":
         trim = True
         headers = headers[:-1]
-    for line in lines[1:]:
-        cols = line.split(sep)
-        assert len(cols) == len(items)
-        if trim:
-            data.append(cols[:-1])
-        else:
-            data.append(cols)
+    # Split all rows in one comprehension to keep the per-row work in C.
+    data = [line.split(sep) for line in lines[1:]]
+    if any(len(cols) != len(items) for cols in data):
+        raise RuntimeError(
+            "Could not process DryCal table: the number of columns in the data "
+            "rows does not match the header."
+        )
+    if trim:
+        data = [cols[:-1] for cols in data]
 
     units = dgutils.sanitize_units(units)
     return headers, units, data
@@ -99,23 +99,26 @@ def extract_from_path(
             break
         elif "Line#" in line:
             headers = [i.strip() for i in line.split(",")]
+            # Index the headers once, so that the rows below can locate their
+            # columns with a dict lookup instead of a list scan per field.
+            hidx = {h: i for i, h in enumerate(headers)}
         else:
             data = [i.strip() for i in line.split(",")]
             sample = {
-                "location": data[headers.index("Location")],
-                "injection date": data[headers.index("Injection Date")],
+                "location": data[hidx["Location"]],
+                "injection date": data[hidx["Injection Date"]],
                 "acquisition": {
-                    "method": data[headers.index("Acq Method Name")],
-                    "version": data[headers.index("Acq Method Version")],
+                    "method": data[hidx["Acq Method Name"]],
+                    "version": data[hidx["Acq Method Version"]],
                 },
                 "integration": {
-                    "method": data[headers.index("Injection DA Method Name")],
-                    "version": data[headers.index("Injection DA Method Version")],
+                    "method": data[hidx["Injection DA Method Name"]],
+                    "version": data[hidx["Injection DA Method Version"]],
                 },
-                "offset": data[headers.index("Time offset")],
+                "offset": data[hidx["Time offset"]],
             }
             if sample["offset"] != "":
-                sn = data[headers.index("Sample Name")]
+                sn = data[hidx["Sample Name"]]
                 samples[sn] = sample
 
     svals = samples.values()
@@ -142,39 +145,40 @@ def extract_from_path(
             break
         elif "Line#" in line:
             headers = [i.strip() for i in line.split(",")]
+            hidx = {h: i for i, h in enumerate(headers)}
         else:
             data = [i.strip() for i in line.split(",")]
-            sn = data[headers.index("Sample Name")]
-            cn = data[headers.index("Compound")]
+            sn = data[hidx["Sample Name"]]
+            cn = data[hidx["Compound"]]
             species.add(cn)
 
-            h = data[headers.index("Peak Height")]
+            h = data[hidx["Peak Height"]]
             if h != "":
                 if "height" not in samples[sn]:
                     samples[sn]["height"] = {}
                 samples[sn]["height"][cn] = tuple_fromstr(h)
 
-            A = data[headers.index("Area")]
+            A = data[hidx["Area"]]
             if A != "":
                 if "area" not in samples[sn]:
                     samples[sn]["area"] = {}
                 samples[sn]["area"][cn] = tuple_fromstr(A)
 
             if metadata["version"] == 2:
-                c = data[headers.index("Concentration")]
+                c = data[hidx["Concentration"]]
             else:
                 logger.warning(
                     "Report version '%d' in file '%s' not understood.",
                     metadata["version"],
                     source,
                 )
-                c = data[headers.index("Concentration")]
+                c = data[hidx["Concentration"]]
             if c != "":
                 if "concentration" not in samples[sn]:
                     samples[sn]["concentration"] = {}
                 samples[sn]["concentration"][cn] = tuple_fromstr(c)
 
-            rt = data[headers.index("RT [min]")]
+            rt = data[hidx["RT [min]"]]
             if rt != "":
                 if "retention time" not in samples[sn]:
                     samples[sn]["retention time"] = {}
@@ -94,23 +94,26 @@ def extract_from_path(
     for row in ws.rows:
         if "Line#" in row[0].value:
             headers = [i.value.replace("\n", "").replace(" ", "") for i in row]
+            # Index the headers once, so that the rows below can locate their
+            # columns with a dict lookup instead of a list scan per field.
+            hidx = {h: i for i, h in enumerate(headers)}
         else:
             data = [str(i.value) if i.value is not None else None for i in row]
             sample = {
-                "location": data[headers.index("Location")],
-                "injection date": data[headers.index("InjectionDate")],
+                "location": data[hidx["Location"]],
+                "injection date": data[hidx["InjectionDate"]],
                 "acquisition": {
-                    "method": data[headers.index("AcqMethodName")],
-                    "version": data[headers.index("AcqMethodVersion")],
+                    "method": data[hidx["AcqMethodName"]],
+                    "version": data[hidx["AcqMethodVersion"]],
                 },
                 "integration": {
-                    "method": data[headers.index("InjectionDAMethodName")],
-                    "version": data[headers.index("InjectionDAMethodVersion")],
+                    "method": data[hidx["InjectionDAMethodName"]],
+                    "version": data[hidx["InjectionDAMethodVersion"]],
                 },
-                "offset": data[headers.index("Timeoffset")],
+                "offset": data[hidx["Timeoffset"]],
             }
             if sample["offset"] is not None:
-                sn = data[headers.index("SampleName")]
+                sn = data[hidx["SampleName"]]
                 sn = sn.replace(" ", "").replace("\n", "")
                 samples[sn] = sample
 
@@ -134,39 +137,40 @@ def extract_from_path(
     for row in ws.rows:
         if "Line#" in str(row[0].value):
             headers = [i.value.replace("\n", "").replace(" ", "") for i in row]
+            hidx = {h: i for i, h in enumerate(headers)}
         else:
             data = [str(i.value) if i.value is not None else None for i in row]
-            sn = data[headers.index("SampleName")].replace("\n", "").replace(" ", "")
-            cn = data[headers.index("Compound")]
+            sn = data[hidx["SampleName"]].replace("\n", "").replace(" ", "")
+            cn = data[hidx["Compound"]]
             species.add(cn)
 
-            h = data[headers.index("PeakHeight")]
+            h = data[hidx["PeakHeight"]]
             if h is not None:
                 if "height" not in samples[sn]:
                     samples[sn]["height"] = {}
                 samples[sn]["height"][cn] = tuple_fromstr(h)
 
-            A = data[headers.index("Area")]
+            A = data[hidx["Area"]]
             if A is not None:
                 if "area" not in samples[sn]:
                     samples[sn]["area"] = {}
                 samples[sn]["area"][cn] = tuple_fromstr(A)
 
             if metadata["version"] == 2:
-                c = data[headers.index("Concentration")]
+                c = data[hidx["Concentration"]]
             else:
                 logger.warning(
                     "Report version '%d' in file '%s' not understood.",
                     metadata["version"],
                     source,
                 )
-                c = data[headers.index("Concentration")]
+                c = data[hidx["Concentration"]]
             if c is not None:
                 if "concentration" not in samples[sn]:
                     samples[sn]["concentration"] = {}
                 samples[sn]["concentration"][cn] = tuple_fromstr(c)
 
-            rt = data[headers.index("RT[min]")]
+            rt = data[hidx["RT[min]"]]
             if rt is not None:
                 if "retention time" not in samples[sn]:
                     samples[sn]["retention time"] = {}
@@ -48,13 +48,35 @@ from yadg import dgutils
 from pathlib import Path
 from yadg.extractors import get_extract_dispatch
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 extract = get_extract_dispatch()
 
 
 logger = logging.getLogger(__name__)
 
 
-def chromdata(jsdata: dict, uts: float) -> Dataset:
+def load_json(source: Path | bytes, encoding: str) -> dict:
+    """
+    Deserialise a fusion-data JSON file or buffer, using :mod:`orjson` when available,
+    as it is considerably faster than the stdlib :mod:`json` on the large signal
+    arrays.
+    """
+    if isinstance(source, bytes):
+        if orjson is not None:
+            return orjson.loads(source)
+        return json.loads(source.decode(encoding, errors="ignore"))
+    if orjson is not None:
+        with open(source, "rb") as infile:
+            return orjson.loads(infile.read())
+    with open(source, "r", encoding=encoding, errors="ignore") as infile:
+        return json.load(infile)
+
+
+def _metadata(jsdata: dict) -> dict:
     metadata = {}
     metadata["method"] = jsdata["methodName"]
     metadata["version"] = jsdata["softwareVersion"]["version"]
@@ -62,7 +84,74 @@ def chromdata(jsdata: dict, uts: float) -> Dataset:
         metadata["datafile"] = jsdata["sequence"].get("location")
     if jsdata.get("annotations") is not None:
         metadata["sampleid"] = jsdata["annotations"].get("name", None)
+    return metadata
+
+
+# Mapping of peak keys in the json file to data_vars, with the absolute and relative
+# uncertainties of their values.
+_peak_fields = (
+    ("height", "height", 1.0, 0.0),
+    ("area", "area", 0.01, 0.0),
+    ("concentration", "concentration", 0.0, 1e-3),
+    ("normalizedConcentration", "xout", 0.0, 1e-3),
+    ("top", "retention time", 0.01, 0.0),
+)
+
+
+def _peak_values(jsdata: dict, species: set, detectors: list[str]) -> dict:
+    raw = {field: {} for _, field, _, _ in _peak_fields}
+
+    for detname in detectors:
+        detdict = jsdata["detectors"][detname]
+        if "analysis" not in detdict:
+            continue
+        peaks = [p for p in detdict["analysis"]["peaks"] if "label" in p]
+        if len(peaks) == 0:
+            continue
+        labels = [p["label"] for p in peaks]
+        species.update(labels)
+        # The key layout is fixed per instrument and method, so fields that do not
+        # appear in any peak of this detector can be dropped up front.
+        present = set()
+        for p in peaks:
+            present.update(p.keys())
+        # Peaks with an explicit null value are skipped from that field onwards,
+        # matching the behaviour of the per-peak parsing this replaces.
+        alive = np.ones(len(peaks), dtype=bool)
+        for key, field, atol, rtol in _peak_fields:
+            if key not in present:
+                continue
+            vals = np.array(
+                [np.nan if p.get(key) is None else float(p[key]) for p in peaks],
+                dtype=np.float64,
+            )
+            devs = atol + vals * rtol
+            for i in np.flatnonzero(alive & ~np.isnan(vals)):
+                raw[field][labels[i]] = (vals[i], devs[i])
+            alive &= np.fromiter(
+                (key not in p or p[key] is not None for p in peaks),
+                dtype=bool,
+                count=len(peaks),
+            )
+    return raw
+
+
+def chromdata(jsdata: dict, uts: float, detectors: list[str] | None = None) -> Dataset:
+    return chromdata_many([jsdata], [uts], None if detectors is None else [detectors])
 
+
+def chromdata_many(
+    jsdata_list: list[dict],
+    uts_list: list[float],
+    detectors_list: list[list[str]] | None = None,
+) -> Dataset:
+    """
+    Batched version of :func:`chromdata`.
+
+    Builds a single ``(uts, species)``-shaped :class:`Dataset` from the supplied
+    files, avoiding the per-file Dataset construction and the repeated
+    :func:`xarray.concat` calls when merging file-by-file.
+    """
     units = {
         "height": None,
         "area": None,
@@ -71,88 +160,69 @@ def chromdata(jsdata: dict, uts: float) -> Dataset:
         "retention time": "s",
     }
 
-    raw = {
-        "height": {},
-        "area": {},
-        "concentration": {},
-        "xout": {},
-        "retention time": {},
-    }
+    if detectors_list is None:
+        # sort detector keys to ensure alphabetic order for ID matching
+        detectors_list = [sorted(j["detectors"].keys()) for j in jsdata_list]
 
+    metadata = None
     species = set()
-
-    # sort detector keys to ensure alphabetic order for ID matching
-    for detname in sorted(jsdata["detectors"].keys()):
-        detdict = jsdata["detectors"][detname]
-        if "analysis" in detdict:
-            for peak in detdict["analysis"]["peaks"]:
-                if "label" not in peak:
-                    continue
-                else:
-                    species.add(peak["label"])
-                if "height" in peak:
-                    if peak["height"] is None:
-                        continue
-                    raw["height"][peak["label"]] = (float(peak["height"]), 1.0)
-                if "area" in peak:
-                    if peak["area"] is None:
-                        continue
-                    raw["area"][peak["label"]] = (float(peak["area"]), 0.01)
-                if "concentration" in peak:
-                    if peak["concentration"] is None:
-                        continue
-                    raw["concentration"][peak["label"]] = (
-                        float(peak["concentration"]),
-                        float(peak["concentration"]) * 1e-3,
-                    )
-                if "normalizedConcentration" in peak:
-                    if peak["normalizedConcentration"] is None:
-                        continue
-                    raw["xout"][peak["label"]] = (
-                        float(peak["normalizedConcentration"]),
-                        float(peak["normalizedConcentration"]) * 1e-3,
-                    )
-                if "top" in peak:
-                    if peak["top"] is None:
-                        continue
-                    raw["retention time"][peak["label"]] = (float(peak["top"]), 0.01)
-
-    valve = jsdata.get("annotations", {}).get("valcoPosition", None)
-    if valve is not None:
-        raw["valve"] = valve
+    raws = []
+    for jsdata, detectors in zip(jsdata_list, detectors_list):
+        md = _metadata(jsdata)
+        if metadata is None:
+            metadata = md
+        elif md != metadata:
+            raise RuntimeError(
+                "Merging metadata from multiple files has failed, as some of the "
+                "values differ between files. This might be caused by trying to "
+                "parse data obtained using different methods in a single step."
+                f"\n{metadata=}"
+                f"\n{md=}"
+            )
+        raws.append(_peak_values(jsdata, species, detectors))
 
     species = sorted(species)
+    sidx = {s: i for i, s in enumerate(species)}
+    dims = ("uts", "species")
+    shape = (len(raws), len(species))
     data_vars = {}
     for k, v in units.items():
-        vals, devs = zip(*[raw[k].get(s, (np.nan, np.nan)) for s in species])
-        data_vars[k] = (
-            ["uts", "species"],
-            [vals],
-            {"ancillary_variables": f"{k}_std_err"},
-        )
-        data_vars[f"{k}_std_err"] = (
-            ["uts", "species"],
-            [devs],
-            {"standard_name": f"{k} stdandard_error"},
-        )
+        vals = np.full(shape, np.nan)
+        devs = np.full(shape, np.nan)
+        for ri, raw in enumerate(raws):
+            for s, (val, dev) in raw[k].items():
+                vals[ri, sidx[s]] = val
+                devs[ri, sidx[s]] = dev
+        attrs = {"ancillary_variables": f"{k}_std_err"}
+        err_attrs = {"standard_name": f"{k} stdandard_error"}
         if v is not None:
-            data_vars[k][2]["units"] = v
-            data_vars[f"{k}_std_err"][2]["units"] = v
+            attrs["units"] = v
+            err_attrs["units"] = v
+        data_vars[k] = (dims, vals, attrs)
+        data_vars[f"{k}_std_err"] = (dims, devs, err_attrs)
 
     ds = xr.Dataset(
         data_vars=data_vars,
-        coords={"species": (["species"], species), "uts": (["uts"], [uts])},
+        coords={"species": (["species"], species), "uts": (["uts"], list(uts_list))},
         attrs=dict(original_metadata=metadata),
     )
     return ds
 
 
-def chromtrace(jsdata: dict, uts: float) -> DataTree:
-    # sort detector keys to ensure alphabetic order for ID matching
-    traces = sorted(jsdata["detectors"].keys())
+def chromtrace(
+    jsdata: dict, uts: float, detectors: list[str] | None = None
+) -> DataTree:
+    if detectors is None:
+        # sort detector keys to ensure alphabetic order for ID matching
+        detectors = sorted(jsdata["detectors"].keys())
+    traces = detectors
+    # The valve position is invariant across detectors, look it up once.
+    valve = jsdata.get("annotations", {}).get("valcoPosition", None)
     vals = {}
     for detname in traces:
         detdict = jsdata["detectors"][detname]
+        npoints = detdict["nValuesExpected"]
+        tstep = 1.0 / float(detdict["nValuesPerSecond"])
         fvals = xr.Dataset(
             data_vars={
                 "signal": (
@@ -162,26 +232,25 @@ def chromtrace(jsdata: dict, uts: float) -> DataTree:
                 ),
                 "signal_std_err": (
                     ["uts", "elution_time"],
-                    [np.ones(detdict["nValuesExpected"])],
+                    [np.ones(npoints)],
                     {"standard_name": "signal standard_error"},
                 ),
                 "elution_time_std_err": (
                     ["elution_time"],
-                    np.ones(detdict["nValuesExpected"]) / detdict["nValuesPerSecond"],
+                    np.full(npoints, tstep),
                     {"units": "s", "standard_name": "elution_time standard_error"},
                 ),
             },
             coords={
                 "elution_time": (
                     ["elution_time"],
-                    np.arange(detdict["nValuesExpected"]) / detdict["nValuesPerSecond"],
+                    np.arange(npoints) * tstep,
                     {"units": "s", "ancillary_variables": "elution_time_std_err"},
                 ),
                 "uts": (["uts"], [uts]),
             },
             attrs={},
         )
-        valve = jsdata.get("annotations", {}).get("valcoPosition", None)
         if valve is not None:
             fvals["valve"] = valve
         vals[detname] = fvals
@@ -198,11 +267,11 @@ def extract_from_path(
     timezone: str,
     **kwargs: dict,
 ) -> DataTree:
-    with open(source, "r", encoding=encoding, errors="ignore") as infile:
-        jsdata = json.load(infile)
+    jsdata = load_json(source, encoding)
     uts = dgutils.str_to_uts(timestamp=jsdata["runTimeStamp"], timezone=timezone)
-    data = chromdata(jsdata, uts)
-    trace = chromtrace(jsdata, uts)
+    detectors = sorted(jsdata["detectors"].keys())
+    data = chromdata(jsdata, uts, detectors)
+    trace = chromtrace(jsdata, uts, detectors)
     newdt = DataTree(data)
     for k, v in trace.items():
         newdt[k] = v
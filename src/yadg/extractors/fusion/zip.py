@@ -43,10 +43,8 @@ No metadata is currently extracted.
 """
 
 import zipfile
-import tempfile
-import os
 from xarray import DataTree
-from yadg.extractors.fusion.json import extract as extract_json
+from yadg.extractors.fusion.json import chromdata_many, chromtrace, load_json
 from yadg import dgutils
 from pathlib import Path
 from yadg.extractors import get_extract_dispatch
@@ -62,15 +60,25 @@ def extract_from_path(
     encoding: str,
     **kwargs: dict,
 ) -> DataTree:
-    zf = zipfile.ZipFile(source)
-    with tempfile.TemporaryDirectory() as tempdir:
-        zf.extractall(tempdir)
-        dt = None
-        filenames = [ffn for ffn in os.listdir(tempdir) if ffn.endswith("fusion-data")]
-        for ffn in sorted(filenames):
-            path = Path(tempdir) / ffn
-            fdt = extract_json(
-                source=path, timezone=timezone, encoding=encoding, **kwargs
+    jsons = []
+    utss = []
+    with zipfile.ZipFile(source) as zf:
+        for ffn in sorted(n for n in zf.namelist() if n.endswith("fusion-data")):
+            jsdata = load_json(zf.read(ffn), encoding)
+            jsons.append(jsdata)
+            utss.append(
+                dgutils.str_to_uts(timestamp=jsdata["runTimeStamp"], timezone=timezone)
             )
-            dt = dgutils.merge_dicttrees(dt, fdt.to_dict(), "identical")
-    return DataTree.from_dict(dt)
+    # Batch the post-processed data into a single Dataset, merge only the traces.
+    dets = [sorted(jsdata["detectors"].keys()) for jsdata in jsons]
+    traces = dgutils.merge_dicttrees(
+        [
+            chromtrace(jsdata, uts, detectors).to_dict()
+            for jsdata, uts, detectors in zip(jsons, utss, dets)
+        ],
+        "identical",
+    )
+    newdt = DataTree(chromdata_many(jsons, utss, dets))
+    for k, v in DataTree.from_dict(traces).items():
+        newdt[k] = v
+    return newdt